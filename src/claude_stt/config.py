@@ -1,5 +1,6 @@
 """Configuration management for claude-stt."""
 
+import functools
 import logging
 import os
 import platform
@@ -24,6 +25,15 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_config_dir(override: str | None, home: str | None) -> Path:
+    """Build the config dir path; cached on the env values it depends on."""
+    if override:
+        return Path(override).expanduser()
+    base = Path(home) if home else Path.home()
+    return base / ".claude" / "plugins" / "claude-stt"
+
+
 @dataclass
 class Config:
     """claude-stt configuration."""
@@ -51,10 +61,11 @@ class Config:
     @classmethod
     def get_config_dir(cls) -> Path:
         """Get the configuration directory path."""
-        override = os.environ.get("CLAUDE_STT_CONFIG_DIR")
-        if override:
-            return Path(override).expanduser()
-        return Path.home() / ".claude" / "plugins" / "claude-stt"
+        return _resolve_config_dir(
+            os.environ.get("CLAUDE_STT_CONFIG_DIR"),
+            # The variable Path.home() itself consults on this platform.
+            os.environ.get("USERPROFILE" if os.name == "nt" else "HOME"),
+        )
 
     @classmethod
     def _legacy_config_path(cls) -> Path | None:
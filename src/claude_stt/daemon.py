@@ -1,31 +1,39 @@
 """Main daemon process for claude-stt."""
 
-import argparse
+import functools
 import json
 import logging
 import os
 import platform
+import re
+import select
 import signal
 import subprocess
 import sys
-import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Optional
 
 from .config import Config
-from .engine_factory import build_engine
 from .errors import EngineError, HotkeyError
-from .hotkey import HotkeyListener
-from .keyboard import test_injection
-from .daemon_service import STTDaemon
+
+# Engine, hotkey, keyboard and daemon-service modules pull in numpy, pynput
+# and sounddevice; they are imported where needed so `toggle` stays fast.
 
 logger = logging.getLogger(__name__)
 
 
 def get_pid_file() -> Path:
     """Get the PID file path."""
-    return Config.get_config_dir() / "daemon.pid"
+    return _pid_file_in(Config.get_config_dir())
+
+
+@functools.lru_cache(maxsize=8)
+def _pid_file_in(config_dir: Path) -> Path:
+    return config_dir / "daemon.pid"
 
 
 def _get_plugin_root() -> Path:
@@ -62,6 +70,24 @@ def _read_pid_file() -> Optional[dict]:
         return None
 
 
+_PID_FIELD_RE = re.compile(rb'"pid"\s*:\s*(\d+)')
+
+
+def _read_pid_only() -> Optional[int]:
+    """Extract just the PID from the PID file without a full JSON parse."""
+    try:
+        raw = get_pid_file().read_bytes()
+    except OSError:
+        return None
+    match = _PID_FIELD_RE.search(raw)
+    if match:
+        return int(match.group(1))
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return None
+
+
 def _write_pid_file(pid: int) -> None:
     data = {
         "pid": pid,
@@ -69,25 +95,25 @@ def _write_pid_file(pid: int) -> None:
         "created_at": time.time(),
         "config_dir": str(Config.get_config_dir()),
     }
+    start_time = _process_start_time(pid)
+    if start_time is not None:
+        # Identifies this exact process; a reused PID has a different one.
+        data["start_time"] = start_time
+    payload = json.dumps(data).encode("utf-8")
     pid_file = get_pid_file()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
-    temp_file = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            "w",
-            delete=False,
-            dir=str(pid_file.parent),
-            encoding="utf-8",
-        ) as handle:
-            temp_file = Path(handle.name)
-            handle.write(json.dumps(data))
-        os.replace(temp_file, pid_file)
-    finally:
-        if temp_file and temp_file.exists():
-            try:
-                temp_file.unlink()
-            except OSError:
-                pass
+    # Concurrent starts (e.g. several sessions opening at once) can race
+    # here, so each writer gets its own sidecar before the atomic replace.
+    temp_file = pid_file.with_name(f"daemon.pid.{os.getpid()}.tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, payload)
+    except BaseException:
+        os.close(fd)
+        temp_file.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(temp_file, pid_file)
 
 
 def is_daemon_running() -> bool:
@@ -102,13 +128,18 @@ def is_daemon_running() -> bool:
         if pid <= 0:
             pid_file.unlink(missing_ok=True)
             return False
+        if pid == os.getpid():
+            return True
         if not _pid_exists(pid):
             pid_file.unlink(missing_ok=True)
             return False
-        command = _get_process_command(pid)
-        if command is None:
-            return True
-        if "claude-stt" not in command and "claude_stt" not in command:
+        same_process = _pid_file_matches_process(data, pid)
+        if same_process is not None:
+            if not same_process:
+                logger.warning("PID file is from an earlier process; removing stale PID file")
+                pid_file.unlink(missing_ok=True)
+            return same_process
+        if _pid_looks_like_claude_stt(pid) is False:
             logger.warning(
                 "PID file points to non-claude-stt process; removing stale PID file"
             )
@@ -122,18 +153,122 @@ def is_daemon_running() -> bool:
         return False
 
 
+def _pid_file_matches_process(data: dict, pid: int) -> Optional[bool]:
+    """Compare the recorded start time with the live PID's.
+
+    Returns None when either side is unknown (legacy PID file, or no procfs),
+    in which case callers fall back to the command line check.
+    """
+    recorded = data.get("start_time")
+    if not isinstance(recorded, int):
+        return None
+    current = _process_start_time(pid)
+    if current is None:
+        return None
+    return current == recorded
+
+
+def _process_start_time(pid: int) -> Optional[int]:
+    """Return the process start time in clock ticks since boot, from procfs."""
+    try:
+        fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError:
+        return None
+    try:
+        raw = os.read(fd, 4096)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    # comm (field 2) may contain spaces or parens; fields resume after the
+    # last ")". starttime is field 22, i.e. the 20th after comm.
+    fields = raw[raw.rfind(b")") + 2 :].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+# Short-lived cache of pid -> command line lookup. Status/stop/spawn checks
+# hit the same PID several times in a row; each miss may cost a ps/wmic
+# subprocess. Entries are futures so a lookup prefetched on the pool below
+# and a later synchronous call share one result.
+_PROCESS_COMMAND_TTL = 2.0
+_PROCESS_COMMAND_TIMEOUT = 2.0
+_process_command_cache: dict[int, tuple[float, Future]] = {}
+_lookup_pool: Optional[ThreadPoolExecutor] = None
+_lookup_pool_lock = threading.Lock()
+
+
+def _get_lookup_pool() -> ThreadPoolExecutor:
+    global _lookup_pool
+    with _lookup_pool_lock:
+        if _lookup_pool is None:
+            _lookup_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="claude-stt-proc"
+            )
+        return _lookup_pool
+
+
+def _cached_process_command(pid: int) -> Optional[Future]:
+    cached = _process_command_cache.get(pid)
+    if cached is not None and time.monotonic() - cached[0] < _PROCESS_COMMAND_TTL:
+        return cached[1]
+    return None
+
+
+def _prefetch_process_command(pid: int) -> Future:
+    """Start a command lookup on the background pool and cache its future."""
+    future = _cached_process_command(pid)
+    if future is None:
+        future = _get_lookup_pool().submit(_get_process_command_uncached, pid)
+        _process_command_cache[pid] = (time.monotonic(), future)
+    return future
+
+
 def _get_process_command(pid: int) -> Optional[str]:
+    future = _cached_process_command(pid)
+    if future is None:
+        # Nothing in flight: looking up inline beats a thread hand-off.
+        future = Future()
+        _process_command_cache[pid] = (time.monotonic(), future)
+        try:
+            future.set_result(_get_process_command_uncached(pid))
+        except BaseException as exc:
+            future.set_exception(exc)
+    try:
+        return future.result(timeout=_PROCESS_COMMAND_TIMEOUT)
+    except FutureTimeoutError:
+        logger.debug("Process command lookup for PID %s timed out", pid)
+        return None
+    except BaseException:
+        _invalidate_process_command(pid)
+        raise
+
+
+def _invalidate_process_command(pid: Optional[int] = None) -> None:
+    if pid is None:
+        _process_command_cache.clear()
+    else:
+        _process_command_cache.pop(pid, None)
+
+
+def _get_process_command_uncached(pid: int) -> Optional[str]:
     if os.name == "nt":
         return _get_windows_process_command(pid)
 
-    proc_cmdline = Path(f"/proc/{pid}/cmdline")
-    if proc_cmdline.exists():
-        try:
-            raw = proc_cmdline.read_text(encoding="utf-8", errors="replace")
-            command = " ".join(part for part in raw.split("\x00") if part)
-            return command or None
-        except Exception:
-            logger.debug("Failed to read /proc cmdline", exc_info=True)
+    try:
+        raw = _read_proc_cmdline(pid)
+    except FileNotFoundError:
+        if os.path.isdir("/proc/self"):
+            # procfs is mounted but has no entry: the process is gone, ps
+            # won't know any better.
+            return None
+    except OSError:
+        logger.debug("Failed to read /proc cmdline", exc_info=True)
+    else:
+        parts = [part for part in raw.split(b"\x00") if part]
+        return b" ".join(parts).decode("utf-8", errors="replace") or None
 
     result = subprocess.run(
         ["ps", "-p", str(pid), "-o", "command="],
@@ -147,7 +282,24 @@ def _get_process_command(pid: int) -> Optional[str]:
     return command or None
 
 
+def _read_proc_cmdline(pid: int) -> bytes:
+    """Return the raw NUL-separated /proc cmdline (first 8 KiB is plenty)."""
+    fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        return os.read(fd, 8192)
+    finally:
+        os.close(fd)
+
+
 def _get_windows_process_command(pid: int) -> Optional[str]:
+    try:
+        command = _windows_native_process_command(pid)
+    except OSError:
+        logger.debug("Native command line lookup failed", exc_info=True)
+    else:
+        if command is not None:
+            return command
+
     try:
         result = subprocess.run(
             ["wmic", "process", "where", f"ProcessId={pid}", "get", "CommandLine"],
@@ -188,13 +340,29 @@ def _get_windows_process_command(pid: int) -> Optional[str]:
     return command or None
 
 
-def _pid_looks_like_claude_stt(pid: int) -> bool:
-    command = _get_process_command(pid)
-    if not command:
-        return False
+def _command_looks_like_claude_stt(command: str) -> bool:
     return "claude-stt" in command or "claude_stt" in command
 
 
+def _cmdline_matches_claude_stt(raw: bytes) -> bool:
+    # Neither marker contains a NUL, so raw /proc bytes can be searched
+    # directly without splitting or decoding.
+    return b"claude-stt" in raw or b"claude_stt" in raw
+
+
+def _pid_looks_like_claude_stt(pid: int) -> Optional[bool]:
+    """Check the PID's command line; None when it can't be determined."""
+    if os.name != "nt" and _cached_process_command(pid) is None:
+        try:
+            return _cmdline_matches_claude_stt(_read_proc_cmdline(pid))
+        except OSError:
+            pass
+    command = _get_process_command(pid)
+    if command is None:
+        return None
+    return _command_looks_like_claude_stt(command)
+
+
 def _pid_exists(pid: int) -> bool:
     if pid <= 0:
         return False
@@ -209,21 +377,130 @@ def _pid_exists(pid: int) -> bool:
         return False
 
 
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_SYNCHRONIZE = 0x00100000
+
+
+def _windows_open_process(pid: int, access: int = _PROCESS_QUERY_LIMITED_INFORMATION):
+    """Open a handle to ``pid``; caller must CloseHandle it."""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    return kernel32.OpenProcess(access, False, pid)
+
+
 def _windows_pid_exists(pid: int) -> bool:
     try:
         import ctypes
 
-        kernel32 = ctypes.windll.kernel32
-        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, 0, pid)
+        handle = _windows_open_process(pid)
         if handle:
-            kernel32.CloseHandle(handle)
+            ctypes.windll.kernel32.CloseHandle(handle)
             return True
         return False
     except Exception:
         return False
 
 
+def _windows_native_process_command(pid: int) -> Optional[str]:
+    """Read a process command line in-process via NtQueryInformationProcess.
+
+    QueryFullProcessImageNameW only yields the interpreter path, which cannot
+    tell claude-stt apart from any other Python process, so ask for
+    ProcessCommandLineInformation (Windows 8.1+) on the same handle instead.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class _UnicodeString(ctypes.Structure):
+        _fields_ = [
+            ("Length", wintypes.USHORT),
+            ("MaximumLength", wintypes.USHORT),
+            ("Buffer", ctypes.c_void_p),
+        ]
+
+    ProcessCommandLineInformation = 60
+    kernel32 = ctypes.windll.kernel32
+    ntdll = ctypes.windll.ntdll
+    ntdll.NtQueryInformationProcess.restype = ctypes.c_long
+    ntdll.NtQueryInformationProcess.argtypes = [
+        wintypes.HANDLE,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        wintypes.ULONG,
+        ctypes.POINTER(wintypes.ULONG),
+    ]
+
+    handle = _windows_open_process(pid)
+    if not handle:
+        return None
+    try:
+        size = wintypes.ULONG(0)
+        ntdll.NtQueryInformationProcess(
+            handle, ProcessCommandLineInformation, None, 0, ctypes.byref(size)
+        )
+        if size.value < ctypes.sizeof(_UnicodeString):
+            return None
+        buffer = ctypes.create_string_buffer(size.value)
+        status = ntdll.NtQueryInformationProcess(
+            handle, ProcessCommandLineInformation, buffer, size, ctypes.byref(size)
+        )
+        if status != 0:
+            return None
+        command_line = _UnicodeString.from_buffer(buffer)
+        if not command_line.Buffer or not command_line.Length:
+            return None
+        command = ctypes.wstring_at(command_line.Buffer, command_line.Length // 2)
+        return command.strip() or None
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+_READY_FD_ENV = "CLAUDE_STT_READY_FD"
+_STARTUP_TIMEOUT = 3.0
+
+
+def _notify_ready() -> None:
+    """Tell a waiting parent (see _spawn_background) that the PID file is written."""
+    value = os.environ.pop(_READY_FD_ENV, None)
+    if not value:
+        return
+    try:
+        fd = int(value)
+        if os.name == "nt":
+            import msvcrt
+
+            fd = msvcrt.open_osfhandle(fd, 0)
+        try:
+            os.write(fd, b"1")
+        finally:
+            os.close(fd)
+    except (ValueError, OSError):
+        logger.debug("Failed to signal daemon readiness", exc_info=True)
+
+
+def _wait_for_ready(read_fd: int, timeout: float) -> bool:
+    """Block until the child writes its readiness byte, exits, or times out."""
+    if os.name == "nt":
+        # select() only handles sockets on Windows; do the blocking read on a
+        # helper thread instead.
+        result: list[bytes] = []
+        reader = threading.Thread(
+            target=lambda: result.append(os.read(read_fd, 1)),
+            name="claude-stt-ready",
+            daemon=True,
+        )
+        reader.start()
+        reader.join(timeout)
+        return result == [b"1"]
+
+    ready, _, _ = select.select([read_fd], [], [], timeout)
+    return bool(ready) and os.read(read_fd, 1) == b"1"
+
+
 def _spawn_background() -> bool:
     """Spawn daemon in background using subprocess (all platforms)."""
     log_file = Config.get_config_dir() / "daemon.log"
@@ -244,32 +521,60 @@ def _spawn_background() -> bool:
         creationflags |= getattr(subprocess, "DETACHED_PROCESS", 0)
         creationflags |= getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
 
-    try:
-        with open(log_file, "a", encoding="utf-8") as log_handle:
-            subprocess.Popen(
-                cmd,
-                env=env,
-                stdout=log_handle,
-                stderr=log_handle,
-                stdin=subprocess.DEVNULL,
-                # Linux/X11 hotkeys fail if we detach into a new session.
-                start_new_session=(os.name != "nt" and platform.system() == "Darwin"),
-                creationflags=creationflags,
-            )
+    # The child writes one byte to this pipe once its PID file exists, so we
+    # can block on it instead of polling is_daemon_running().
+    read_fd, write_fd = os.pipe()
+    popen_kwargs: dict = {}
+    if os.name == "nt":
+        import msvcrt
+
+        write_handle = msvcrt.get_osfhandle(write_fd)
+        os.set_handle_inheritable(write_handle, True)
+        env[_READY_FD_ENV] = str(write_handle)
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.lpAttributeList = {"handle_list": [write_handle]}
+        popen_kwargs["startupinfo"] = startupinfo
+    else:
+        env[_READY_FD_ENV] = str(write_fd)
+        popen_kwargs["pass_fds"] = (write_fd,)
 
-        for _ in range(30):
-            if is_daemon_running():
-                logger.info("Daemon started in background.")
-                return True
-            time.sleep(0.1)
+    try:
+        try:
+            with open(log_file, "a", encoding="utf-8") as log_handle:
+                process = subprocess.Popen(
+                    cmd,
+                    env=env,
+                    stdout=log_handle,
+                    stderr=log_handle,
+                    stdin=subprocess.DEVNULL,
+                    # Linux/X11 hotkeys fail if we detach into a new session.
+                    start_new_session=(os.name != "nt" and platform.system() == "Darwin"),
+                    creationflags=creationflags,
+                    **popen_kwargs,
+                )
+        finally:
+            # Only the child may hold the write end, so EOF means it exited.
+            os.close(write_fd)
+
+        if _wait_for_ready(read_fd, _STARTUP_TIMEOUT) or is_daemon_running():
+            logger.info("Daemon started in background.")
+            return True
 
-        logger.warning(
-            "Daemon did not start within 3 seconds. Check %s", log_file
-        )
+        exit_code = process.poll()
+        if exit_code is not None:
+            logger.warning(
+                "Daemon exited during startup (code %s). Check %s", exit_code, log_file
+            )
+        else:
+            logger.warning(
+                "Daemon did not start within 3 seconds. Check %s", log_file
+            )
         return False
     except Exception:
         logger.exception("Failed to spawn background daemon")
         return False
+    finally:
+        os.close(read_fd)
 
 
 def start_daemon(background: bool = False):
@@ -290,6 +595,9 @@ def start_daemon(background: bool = False):
         )
 
     _write_pid_file(os.getpid())
+    _notify_ready()
+
+    from .daemon_service import STTDaemon
 
     try:
         daemon = STTDaemon()
@@ -304,19 +612,19 @@ def toggle_recording():
         logger.error("Toggle recording is not supported on this platform.")
         return False
 
-    data = _read_pid_file()
-    if not data:
+    pid = _read_pid_only()
+    if pid is None or pid <= 0:
         logger.error("Daemon is not running.")
         return False
 
+    # No separate liveness probe: the kill itself reports ESRCH.
     try:
-        pid = int(data["pid"])
-        if not _pid_exists(pid):
-            logger.error("Daemon is not running.")
-            return False
         os.kill(pid, signal.SIGUSR1)
         logger.info("Sent toggle signal to daemon (PID %s)", pid)
         return True
+    except ProcessLookupError:
+        logger.error("Daemon is not running.")
+        return False
     except PermissionError:
         logger.error("Permission denied sending signal to daemon")
         return False
@@ -335,8 +643,7 @@ def stop_daemon():
     pid_file = get_pid_file()
     try:
         pid = int(data["pid"])
-        command = _get_process_command(pid)
-        if command is not None and not _pid_looks_like_claude_stt(pid):
+        if _pid_looks_like_claude_stt(pid) is False:
             logger.warning(
                 "PID %s does not look like claude-stt; refusing to kill", pid
             )
@@ -348,13 +655,10 @@ def stop_daemon():
             )
             return
         logger.info("Sent stop signal to daemon (PID %s)", pid)
+        _invalidate_process_command(pid)
 
-        # Wait for it to stop
-        for _ in range(50):  # 5 seconds
-            time.sleep(0.1)
-            if not _pid_exists(pid):
-                logger.info("Daemon stopped.")
-                break
+        if _wait_for_exit(pid, timeout=5.0):
+            logger.info("Daemon stopped.")
         else:
             logger.warning("Daemon did not stop gracefully, forcing...")
             _force_kill(pid)
@@ -371,6 +675,76 @@ def stop_daemon():
         pid_file.unlink(missing_ok=True)
 
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for ``pid`` to exit.
+
+    Uses a kernel wait (pidfd, kqueue or a process handle) so we wake as soon
+    as the process is gone, falling back to polling when none is available.
+
+    Returns:
+        True if the process exited within ``timeout`` seconds.
+    """
+    try:
+        if os.name == "nt":
+            return _windows_wait_for_exit(pid, timeout)
+        if hasattr(os, "pidfd_open"):
+            return _pidfd_wait_for_exit(pid, timeout)
+        if hasattr(select, "kqueue"):
+            return _kqueue_wait_for_exit(pid, timeout)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        logger.debug("Kernel process wait unavailable; polling", exc_info=True)
+
+    deadline = time.monotonic() + timeout
+    while _pid_exists(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
+def _pidfd_wait_for_exit(pid: int, timeout: float) -> bool:
+    fd = os.pidfd_open(pid)
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return bool(poller.poll(int(timeout * 1000)))
+    finally:
+        os.close(fd)
+
+
+def _kqueue_wait_for_exit(pid: int, timeout: float) -> bool:
+    kq = select.kqueue()
+    try:
+        event = select.kevent(
+            pid,
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT,
+        )
+        return bool(kq.control([event], 1, timeout))
+    finally:
+        kq.close()
+
+
+def _windows_wait_for_exit(pid: int, timeout: float) -> bool:
+    import ctypes
+    from ctypes import wintypes
+
+    handle = _windows_open_process(pid, _SYNCHRONIZE)
+    if not handle:
+        raise OSError(f"OpenProcess failed for PID {pid}")
+    kernel32 = ctypes.windll.kernel32
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    try:
+        WAIT_OBJECT_0 = 0
+        return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+    finally:
+        kernel32.CloseHandle(handle)
+
+
 def _terminate_process(pid: int) -> bool:
     if os.name == "nt":
         return _taskkill(pid, force=False)
@@ -412,6 +786,16 @@ def _taskkill(pid: int, force: bool) -> bool:
 
 def daemon_status():
     """Print daemon status."""
+    from .engine_factory import build_engine
+    from .hotkey import HotkeyListener
+    from .keyboard import test_injection
+
+    data = _read_pid_file()
+    if data and data["pid"] > 0 and _pid_file_matches_process(data, data["pid"]) is None:
+        # Overlap a possibly slow ps/wmic lookup with config parsing.
+        _prefetch_process_command(data["pid"])
+    config = Config.load().validate()
+
     running = is_daemon_running()
     if running:
         data = _read_pid_file()
@@ -420,7 +804,6 @@ def daemon_status():
     else:
         logger.info("Daemon is not running.")
 
-    config = Config.load().validate()
     logger.info("Config path: %s", Config.get_config_path())
     logger.info("Hotkey: %s", config.hotkey)
     logger.info("Mode: %s", config.mode)
@@ -471,6 +854,15 @@ def setup_logging(level: str) -> None:
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point for the daemon."""
     default_log_level = os.environ.get("CLAUDE_STT_LOG_LEVEL", "INFO")
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv == ["toggle"]:
+        # Hotkey-bound path: skip argparse entirely.
+        setup_logging(default_log_level)
+        return 0 if toggle_recording() else 1
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="claude-stt daemon")
     parser.add_argument(
         "command",
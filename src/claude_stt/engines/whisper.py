@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from typing import Optional
 
 import numpy as np
@@ -19,22 +20,56 @@ except ImportError:
     pass
 
 
+def _default_cpu_threads() -> int:
+    """CTranslate2 defaults to 4 threads; use every usable core unless overridden."""
+    override = os.environ.get("CLAUDE_STT_WHISPER_THREADS")
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    # Respect CPU affinity (taskset, container cpusets) where the OS exposes it.
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
 class WhisperEngine:
     """Whisper speech-to-text engine backed by faster-whisper."""
 
+    # Loaded models shared across engine instances, keyed by their load
+    # arguments; loading is the expensive part.
+    _MODEL_CACHE: dict[tuple, object] = {}
+    _MODEL_CACHE_LOCK = threading.Lock()
+
     def __init__(
         self,
         model_name: str = "medium",
         device: Optional[str] = None,
         compute_type: Optional[str] = None,
+        cpu_threads: Optional[int] = None,
+        download_root: Optional[str] = None,
     ):
         self.model_name = model_name
         self.device = device or os.environ.get("CLAUDE_STT_WHISPER_DEVICE", "cpu")
+        # int8 weights with float16 activations use the GPU's fast paths;
+        # plain int8 is the best CPU choice.
         self.compute_type = compute_type or os.environ.get(
             "CLAUDE_STT_WHISPER_COMPUTE_TYPE",
-            "int8",
+            "int8_float16" if self.device == "cuda" else "int8",
+        )
+        # Thread count only applies to CPU inference.
+        self.cpu_threads = (
+            cpu_threads or _default_cpu_threads() if self.device == "cpu" else None
+        )
+        self.download_root = download_root or os.environ.get(
+            "CLAUDE_STT_WHISPER_DOWNLOAD_ROOT"
         )
         self._model: Optional[object] = None
+        self._scratch: Optional[np.ndarray] = None
         self._logger = logging.getLogger(__name__)
 
     def is_available(self) -> bool:
@@ -45,26 +80,68 @@ class WhisperEngine:
             return False
         if self._model is not None:
             return True
-        try:
-            self._model = _WhisperModel(
-                self.model_name,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
-            return True
-        except Exception:
-            self._logger.exception("Failed to load Whisper model")
-            return False
+        key = (
+            self.model_name,
+            self.device,
+            self.compute_type,
+            self.cpu_threads,
+            self.download_root,
+        )
+        with WhisperEngine._MODEL_CACHE_LOCK:
+            model = WhisperEngine._MODEL_CACHE.get(key)
+            if model is None:
+                options = {}
+                if self.cpu_threads:
+                    options["cpu_threads"] = self.cpu_threads
+                try:
+                    model = _WhisperModel(
+                        self.model_name,
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        num_workers=1,
+                        download_root=self.download_root,
+                        **options,
+                    )
+                except Exception:
+                    self._logger.exception("Failed to load Whisper model")
+                    return False
+                WhisperEngine._MODEL_CACHE[key] = model
+        self._model = model
+        return True
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         if not self.load_model():
             return ""
         try:
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-            segments, _info = self._model.transcribe(audio)
+            audio = self._as_float32(audio)
+            # Dictation is short and interactive: greedy decoding, no
+            # timestamps or cross-window conditioning, and VAD to skip silence.
+            segments, _info = self._model.transcribe(
+                audio,
+                beam_size=1,
+                vad_filter=True,
+                condition_on_previous_text=False,
+                without_timestamps=True,
+                language=os.environ.get("CLAUDE_STT_LANG") or None,
+            )
             text = " ".join(segment.text.strip() for segment in segments)
             return text.strip()
         except Exception:
             self._logger.exception("Whisper transcription failed")
             return ""
+
+    def _as_float32(self, audio: np.ndarray) -> np.ndarray:
+        """Return contiguous float32 audio, copying only when unavoidable.
+
+        int16 PCM is scaled to [-1, 1] into a scratch buffer that is reused
+        across calls, so repeated utterances don't allocate a new array.
+        """
+        if audio.dtype == np.float32:
+            return np.ascontiguousarray(audio)
+        if audio.dtype == np.int16:
+            if self._scratch is None or self._scratch.size < audio.size:
+                self._scratch = np.empty(audio.size, dtype=np.float32)
+            out = self._scratch[: audio.size].reshape(audio.shape)
+            np.multiply(audio, np.float32(1.0 / 32768.0), out=out, casting="unsafe")
+            return out
+        return audio.astype(np.float32)
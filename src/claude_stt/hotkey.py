@@ -1,9 +1,10 @@
 """Global hotkey detection using pynput."""
 
+import functools
 import logging
 import platform
-import queue
 import threading
+from collections import deque
 from typing import Callable, Optional
 
 try:
@@ -18,6 +19,131 @@ except Exception as exc:
 from .errors import HotkeyError
 
 
+def _build_vk_to_key() -> dict:
+    """Map virtual key codes to Key members (first member wins, like pynput)."""
+    mapping: dict = {}
+    if not _PYNPUT_AVAILABLE:
+        return mapping
+    try:
+        for member in keyboard.Key:
+            value = getattr(member, "value", None)
+            vk = getattr(value, "vk", None)
+            if vk is not None:
+                mapping.setdefault(vk, member)
+    except Exception:
+        pass
+    return mapping
+
+
+_VK_TO_KEY = _build_vk_to_key()
+_IS_MACOS = platform.system() == "Darwin"
+_MAC_VK_MAP = (
+    {
+        49: keyboard.Key.space,
+        36: keyboard.Key.enter,
+        48: keyboard.Key.tab,
+        53: keyboard.Key.esc,
+    }
+    if _PYNPUT_AVAILABLE and _IS_MACOS
+    else {}
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_hotkey_string(hotkey_str: str) -> frozenset:
+    """Parse hotkey string to a set of keys.
+
+    Args:
+        hotkey_str: Hotkey like "<ctrl>+<shift>+space" or "ctrl+shift+space".
+
+    Returns:
+        Frozen set of normalized key objects.
+    """
+    if not hotkey_str.strip():
+        raise HotkeyError("Hotkey cannot be empty")
+
+    try:
+        normalized = _normalize_hotkey_string(hotkey_str)
+        keys = keyboard.HotKey.parse(normalized)
+    except Exception as exc:
+        raise HotkeyError(f"Invalid hotkey '{hotkey_str}': {exc}") from exc
+
+    normalized: set = set()
+    for key in keys:
+        normalized_key = _normalize_pynput_key(key)
+        if normalized_key is not None:
+            normalized.add(normalized_key)
+    return frozenset(normalized)
+
+
+def _normalize_hotkey_string(hotkey_str: str) -> str:
+    parts = [part.strip() for part in hotkey_str.split("+") if part.strip()]
+    if not parts:
+        return hotkey_str
+
+    key_map = {
+        "ctrl": "<ctrl>",
+        "control": "<ctrl>",
+        "shift": "<shift>",
+        "alt": "<alt>",
+        "cmd": "<cmd>",
+        "command": "<cmd>",
+        "space": "<space>",
+        "enter": "<enter>",
+        "return": "<enter>",
+        "tab": "<tab>",
+        "esc": "<esc>",
+        "escape": "<esc>",
+    }
+
+    normalized_parts = []
+    for part in parts:
+        lowered = part.lower()
+        if lowered.startswith("<") and lowered.endswith(">"):
+            normalized_parts.append(lowered)
+            continue
+        if lowered in key_map:
+            normalized_parts.append(key_map[lowered])
+            continue
+        if lowered.startswith("f") and lowered[1:].isdigit():
+            normalized_parts.append(f"<{lowered}>")
+            continue
+        normalized_parts.append(lowered)
+
+    return "+".join(normalized_parts)
+
+
+def _normalize_pynput_key(key) -> Optional[object]:
+    """Normalize a key to a comparable form."""
+    if hasattr(key, "char") and key.char:
+        if key.char == " ":
+            return keyboard.Key.space
+        if key.char in ("\n", "\r"):
+            return keyboard.Key.enter
+        return keyboard.KeyCode.from_char(key.char.lower())
+
+    if hasattr(key, "vk") and key.vk is not None:
+        # Normalize KeyCode(vk=...) to Key enum when possible (Linux/X11).
+        member = _VK_TO_KEY.get(key.vk)
+        if member is not None:
+            return member
+
+        if key.vk in _MAC_VK_MAP:
+            return _MAC_VK_MAP[key.vk]
+
+    # Handle left/right modifier variants
+    if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
+        return keyboard.Key.ctrl
+    if key in (keyboard.Key.shift_l, keyboard.Key.shift_r):
+        return keyboard.Key.shift
+    if key in (keyboard.Key.alt_l, keyboard.Key.alt_r):
+        return keyboard.Key.alt
+    if key in (keyboard.Key.cmd_l, keyboard.Key.cmd_r):
+        return keyboard.Key.cmd
+
+    return key
+
+
 class HotkeyListener:
     """Listens for global hotkey events.
 
@@ -45,14 +171,20 @@ class HotkeyListener:
         self.mode = mode
 
         self._listener: Optional[keyboard.Listener] = None
+        self._listener_started = False
         self._is_recording = False
         self._pressed_keys: set = set()
+        self._normalize_cache: dict = {}
         self._hotkey_active = False
-        self._lock = threading.Lock()
+        self._stopped = False
         self._logger = logging.getLogger(__name__)
-        self._event_queue: "queue.Queue[Optional[tuple[str, Optional[Callable[[], None]]]]]" = (
-            queue.Queue(maxsize=8)
+        # Start/stop events for the worker thread. deque appends/pops are
+        # atomic, so an Event is the only synchronization needed; a full deque
+        # drops the oldest event rather than the newest.
+        self._event_deque: "deque[Optional[tuple[str, Optional[Callable[[], None]]]]]" = (
+            deque(maxlen=16)
         )
+        self._event_ready = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
         self._worker_stop = threading.Event()
 
@@ -66,67 +198,11 @@ class HotkeyListener:
         self._hotkey_keys = self._parse_hotkey(hotkey)
         if not self._hotkey_keys:
             raise HotkeyError(f"Hotkey '{hotkey}' did not map to any keys")
+        self._hotkey_len = len(self._hotkey_keys)
 
-    def _parse_hotkey(self, hotkey_str: str) -> set:
-        """Parse hotkey string to a set of keys.
-
-        Args:
-            hotkey_str: Hotkey like "<ctrl>+<shift>+space" or "ctrl+shift+space".
-
-        Returns:
-            Set of key objects.
-        """
-        if not hotkey_str.strip():
-            raise HotkeyError("Hotkey cannot be empty")
-
-        try:
-            normalized = self._normalize_hotkey_string(hotkey_str)
-            keys = keyboard.HotKey.parse(normalized)
-        except Exception as exc:
-            raise HotkeyError(f"Invalid hotkey '{hotkey_str}': {exc}") from exc
-
-        normalized: set = set()
-        for key in keys:
-            normalized_key = self._normalize_key(key)
-            if normalized_key is not None:
-                normalized.add(normalized_key)
-        return normalized
-
-    def _normalize_hotkey_string(self, hotkey_str: str) -> str:
-        parts = [part.strip() for part in hotkey_str.split("+") if part.strip()]
-        if not parts:
-            return hotkey_str
-
-        key_map = {
-            "ctrl": "<ctrl>",
-            "control": "<ctrl>",
-            "shift": "<shift>",
-            "alt": "<alt>",
-            "cmd": "<cmd>",
-            "command": "<cmd>",
-            "space": "<space>",
-            "enter": "<enter>",
-            "return": "<enter>",
-            "tab": "<tab>",
-            "esc": "<esc>",
-            "escape": "<esc>",
-        }
-
-        normalized_parts = []
-        for part in parts:
-            lowered = part.lower()
-            if lowered.startswith("<") and lowered.endswith(">"):
-                normalized_parts.append(lowered)
-                continue
-            if lowered in key_map:
-                normalized_parts.append(key_map[lowered])
-                continue
-            if lowered.startswith("f") and lowered[1:].isdigit():
-                normalized_parts.append(f"<{lowered}>")
-                continue
-            normalized_parts.append(lowered)
-
-        return "+".join(normalized_parts)
+    def _parse_hotkey(self, hotkey_str: str) -> frozenset:
+        """Parse hotkey string to a set of keys (cached per string)."""
+        return _parse_hotkey_string(hotkey_str)
 
     def _ensure_worker(self) -> None:
         if self._worker_thread and self._worker_thread.is_alive():
@@ -141,112 +217,98 @@ class HotkeyListener:
 
     def _event_worker(self) -> None:
         while not self._worker_stop.is_set():
-            try:
-                item = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            if item is None:
-                return
-            label, callback = item
-            if not callback:
-                continue
-            try:
-                callback()
-            except Exception:
-                self._logger.exception("Hotkey callback failed: %s", label)
+            self._event_ready.wait()
+            # Clear before draining so an event appended mid-drain re-arms it.
+            self._event_ready.clear()
+            while self._event_deque:
+                item = self._event_deque.popleft()
+                if item is None:
+                    return
+                label, callback = item
+                if not callback:
+                    continue
+                try:
+                    callback()
+                except Exception:
+                    self._logger.exception("Hotkey callback failed: %s", label)
 
     def _enqueue_event(self, label: str, callback: Optional[Callable[[], None]]) -> None:
         self._ensure_worker()
-        try:
-            self._event_queue.put_nowait((label, callback))
-        except queue.Full:
-            self._logger.warning("Dropping hotkey event '%s'; queue full", label)
+        if len(self._event_deque) == self._event_deque.maxlen:
+            self._logger.warning("Hotkey event backlog full; dropping oldest event")
+        self._event_deque.append((label, callback))
+        self._event_ready.set()
 
     def _normalize_key(self, key) -> Optional[object]:
-        """Normalize a key to a comparable form."""
-        if hasattr(key, "char") and key.char:
-            if key.char == " ":
-                return keyboard.Key.space
-            if key.char in ("\n", "\r"):
-                return keyboard.Key.enter
-            return keyboard.KeyCode.from_char(key.char.lower())
-
-        if hasattr(key, "vk") and key.vk is not None:
-            # Normalize KeyCode(vk=...) to Key enum when possible (Linux/X11).
-            try:
-                for member in keyboard.Key:
-                    value = getattr(member, "value", None)
-                    if hasattr(value, "vk") and value.vk == key.vk:
-                        return member
-            except Exception:
-                pass
-
-            if platform.system() == "Darwin":
-                mac_vk_map = {
-                    49: keyboard.Key.space,
-                    36: keyboard.Key.enter,
-                    48: keyboard.Key.tab,
-                    53: keyboard.Key.esc,
-                }
-                if key.vk in mac_vk_map:
-                    return mac_vk_map[key.vk]
-
-        # Handle left/right modifier variants
-        if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-            return keyboard.Key.ctrl
-        if key in (keyboard.Key.shift_l, keyboard.Key.shift_r):
-            return keyboard.Key.shift
-        if key in (keyboard.Key.alt_l, keyboard.Key.alt_r):
-            return keyboard.Key.alt
-        if key in (keyboard.Key.cmd_l, keyboard.Key.cmd_r):
-            return keyboard.Key.cmd
-
-        return key
+        """Normalize a key to a comparable form (memoized per key)."""
+        try:
+            return self._normalize_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return _normalize_pynput_key(key)
+        normalized = _normalize_pynput_key(key)
+        self._normalize_cache[key] = normalized
+        return normalized
 
     def _on_press(self, key):
-        """Handle key press event."""
+        """Handle key press event.
+
+        pynput delivers press/release callbacks serially on its listener
+        thread, so key state is only touched from one thread and needs no
+        lock; ``_stopped`` fences off callbacks that race with stop().
+        """
+        if self._stopped:
+            return
         normalized = self._normalize_key(key)
         if normalized is None:
             return
 
-        with self._lock:
-            self._pressed_keys.add(normalized)
+        self._pressed_keys.add(normalized)
+        # Only a hotkey key can complete the combination; skip the subset
+        # check for ordinary typing.
+        if normalized not in self._hotkey_keys:
+            return
 
-            # Check if hotkey combination is pressed
-            if self._hotkey_keys.issubset(self._pressed_keys):
-                if self._hotkey_active:
-                    return
-                self._hotkey_active = True
-                if self.mode == "toggle":
-                    # Toggle mode: press to start/stop
-                    if not self._is_recording:
-                        self._is_recording = True
-                        self._enqueue_event("start", self.on_start)
-                    else:
-                        self._is_recording = False
-                        self._enqueue_event("stop", self.on_stop)
+        # Check if hotkey combination is pressed
+        if (
+            len(self._pressed_keys) >= self._hotkey_len
+            and self._hotkey_keys <= self._pressed_keys
+        ):
+            if self._hotkey_active:
+                return
+            self._hotkey_active = True
+            if self.mode == "toggle":
+                # Toggle mode: press to start/stop
+                if not self._is_recording:
+                    self._is_recording = True
+                    self._enqueue_event("start", self.on_start)
                 else:
-                    # Push-to-talk: press to start
-                    if not self._is_recording:
-                        self._is_recording = True
-                        self._enqueue_event("start", self.on_start)
+                    self._is_recording = False
+                    self._enqueue_event("stop", self.on_stop)
+            else:
+                # Push-to-talk: press to start
+                if not self._is_recording:
+                    self._is_recording = True
+                    self._enqueue_event("start", self.on_start)
 
     def _on_release(self, key):
         """Handle key release event."""
+        if self._stopped:
+            return
         normalized = self._normalize_key(key)
         if normalized is None:
             return
 
-        with self._lock:
-            self._pressed_keys.discard(normalized)
-            if normalized in self._hotkey_keys:
-                self._hotkey_active = False
+        self._pressed_keys.discard(normalized)
+        if normalized in self._hotkey_keys:
+            self._hotkey_active = False
 
-            # In push-to-talk mode, release any hotkey key to stop
-            if self.mode == "push-to-talk" and self._is_recording:
-                if normalized in self._hotkey_keys:
-                    self._is_recording = False
-                    self._enqueue_event("stop", self.on_stop)
+        # In push-to-talk mode, release any hotkey key to stop
+        if self.mode == "push-to-talk" and self._is_recording:
+            if normalized in self._hotkey_keys:
+                self._is_recording = False
+                self._enqueue_event("stop", self.on_stop)
 
     def start(self) -> bool:
         """Start listening for hotkeys.
@@ -260,6 +322,7 @@ class HotkeyListener:
         if self._listener is not None:
             return True
 
+        self._stopped = False
         try:
             self._listener = keyboard.Listener(
                 on_press=self._on_press,
@@ -267,10 +330,12 @@ class HotkeyListener:
             )
             self._listener.start()
             self._ensure_worker()
-            if not self._listener.is_alive():
+            started = self._listener.is_alive()
+            if not started:
                 self._logger.error("Hotkey listener failed to start")
                 self.stop()
                 return False
+            self._listener_started = started
             return True
         except Exception as e:
             self._logger.error("Failed to start hotkey listener: %s", e)
@@ -278,25 +343,27 @@ class HotkeyListener:
 
     def stop(self):
         """Stop listening for hotkeys."""
+        self._stopped = True
+        self._listener_started = False
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
             self._pressed_keys.clear()
             self._is_recording = False
         self._worker_stop.set()
-        try:
-            self._event_queue.put_nowait(None)
-        except queue.Full:
-            pass
+        self._event_deque.append(None)
+        self._event_ready.set()
         if self._worker_thread:
             self._worker_thread.join(timeout=1.0)
             if self._worker_thread.is_alive():
                 self._logger.warning("Hotkey worker did not exit cleanly")
             self._worker_thread = None
+        # Drop the shutdown sentinel so a restarted worker doesn't exit on it.
+        self._event_deque.clear()
 
     def is_running(self) -> bool:
         """Check if listener is running."""
-        return self._listener is not None and self._listener.is_alive()
+        return self._listener_started and self._listener is not None
 
     @property
     def is_recording(self) -> bool:
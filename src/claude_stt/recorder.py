@@ -2,11 +2,9 @@
 
 import logging
 import math
-import queue
-import threading
-from collections import deque
+import time
 from dataclasses import dataclass
-from typing import Deque, Generator, Optional
+from typing import Generator, Optional
 
 import numpy as np
 
@@ -17,6 +15,23 @@ except Exception as exc:
     sd = None
     _SOUNDDEVICE_IMPORT_ERROR = exc
 
+# Initial buffer size for recordings without max_recording_seconds.
+_UNBOUNDED_INITIAL_SECONDS = 30
+
+# Volume meter range (typical voice levels); adjust based on testing.
+_VOLUME_MIN_DB = -60.0
+_VOLUME_MAX_DB = -10.0
+# (20 * log10(rms) - min_db) / (max_db - min_db) folded into one affine map of
+# log10(rms): level = _LOG10_SCALE * log10(rms) + _LOG10_OFFSET.
+_LOG10_SCALE = 20.0 / (_VOLUME_MAX_DB - _VOLUME_MIN_DB)
+_LOG10_OFFSET = -_VOLUME_MIN_DB / (_VOLUME_MAX_DB - _VOLUME_MIN_DB)
+
+# How long device queries stay cached; PortAudio enumeration takes milliseconds.
+_DEVICE_CACHE_TTL = 5.0
+
+# How often get_chunk re-checks the write index while waiting for audio.
+_CHUNK_POLL_SECONDS = 0.01
+
 
 @dataclass
 class RecorderConfig:
@@ -26,20 +41,11 @@ class RecorderConfig:
     channels: int = 1
     blocksize: int = 1024  # ~64ms at 16kHz
     dtype: str = "float32"
-    queue_maxsize: int = 32
+    queue_maxsize: int = 32  # blocks a streaming reader may lag behind
     max_recording_seconds: Optional[int] = None
     device: Optional[int | str] = None  # None = system default
 
 
-@dataclass
-class AudioChunk:
-    """A chunk of recorded audio."""
-
-    data: np.ndarray
-    sample_rate: int
-    timestamp: float
-
-
 class AudioRecorder:
     """Records audio from the microphone.
 
@@ -54,11 +60,19 @@ class AudioRecorder:
         """
         self.config = config or RecorderConfig()
         self._recording = False
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
         self._stream: Optional["sd.InputStream"] = None
-        self._recorded_chunks: Deque[np.ndarray] = deque()
         self._max_chunks = self._compute_max_chunks()
-        self._lock = threading.Lock()
+        # Recorded frames land directly in one preallocated buffer: a ring of
+        # max_recording_seconds when bounded (oldest audio is overwritten),
+        # otherwise a linear buffer that doubles when full. Frame n lives at
+        # n % capacity. The audio callback is the only writer and publishes
+        # _frames_written after the data is in place; streaming readers only
+        # advance their own _frames_read, so neither side takes a lock.
+        self._buffer: Optional[np.ndarray] = None
+        self._frames_written = 0
+        self._frames_read = 0
+        self._availability_cache: Optional[tuple[float, bool]] = None
+        self._devices_cache: Optional[tuple[float, list[dict]]] = None
         self._logger = logging.getLogger(__name__)
 
     def _compute_max_chunks(self) -> Optional[int]:
@@ -66,19 +80,131 @@ class AudioRecorder:
         if not max_seconds:
             return None
         max_seconds = max(1, int(max_seconds))
-        chunks = max_seconds * self.config.sample_rate / self.config.blocksize
-        return max(1, int(math.ceil(chunks)))
+        blocksize = self.config.blocksize
+        chunks = (max_seconds * self.config.sample_rate + blocksize - 1) // blocksize
+        return max(1, chunks)
+
+    def _reset_buffer(self) -> None:
+        if self._max_chunks:
+            frames = self._max_chunks * self.config.blocksize
+        else:
+            frames = _UNBOUNDED_INITIAL_SECONDS * self.config.sample_rate
+        # A fresh buffer per recording: the previous one may still be in use
+        # by the transcriber. np.empty doesn't touch pages until written.
+        # Mono recordings are stored 1-D so readers never need to squeeze.
+        channels = self.config.channels
+        shape = (frames,) if channels == 1 else (frames, channels)
+        self._buffer = np.empty(shape, dtype=self.config.dtype)
+        self._frames_written = 0
+        self._frames_read = 0
+
+    def _store_block(self, block: np.ndarray) -> None:
+        """Copy one callback block into the recording buffer (producer side)."""
+        buffer = self._buffer
+        if buffer is None:
+            return
+        frames = len(block)
+        first = self._frames_written
+        capacity = len(buffer)
+        if self._max_chunks:
+            if frames > capacity:
+                first += frames - capacity
+                block = block[-capacity:]
+                frames = capacity
+        elif first + frames > capacity:
+            grown = np.empty(
+                (max(capacity * 2, first + frames), *buffer.shape[1:]),
+                dtype=buffer.dtype,
+            )
+            grown[:first] = buffer[:first]
+            # Readers may still hold the old buffer; it stays valid for every
+            # frame published so far.
+            self._buffer = buffer = grown
+            capacity = len(buffer)
+
+        self._copy_in(buffer, first % capacity, block)
+        # Publish only once the frames are in place.
+        self._frames_written = first + frames
+
+    @staticmethod
+    def _copy_in(buffer: np.ndarray, pos: int, block: np.ndarray) -> None:
+        end = pos + len(block)
+        if end <= len(buffer):
+            buffer[pos:end] = block
+        else:
+            split = len(buffer) - pos
+            buffer[pos:] = block[:split]
+            buffer[: len(block) - split] = block[split:]
+
+    @staticmethod
+    def _copy_out(
+        buffer: np.ndarray, first: int, last: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        capacity = len(buffer)
+        pos = first % capacity
+        count = last - first
+        end = pos + count
+        if out is None:
+            if end <= capacity:
+                return buffer[pos:end].copy()
+            return np.concatenate((buffer[pos:], buffer[: end - capacity]))
+        dest = out if count == len(out) else out[:count]
+        if end <= capacity:
+            dest[...] = buffer[pos:end]
+        else:
+            split = capacity - pos
+            dest[:split] = buffer[pos:]
+            dest[split:] = buffer[: end - capacity]
+        return dest
+
+    def _recorded_audio(self) -> Optional[np.ndarray]:
+        """Return recorded frames in order (stream stopped); a view unless wrapped."""
+        buffer = self._buffer
+        written = self._frames_written
+        if buffer is None or written == 0:
+            return None
+        if written <= len(buffer):
+            return buffer[:written]
+        return self._copy_out(buffer, written - len(buffer), written)
+
+    def _read_block(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Copy the next unread block out of the buffer (consumer side)."""
+        written = self._frames_written
+        buffer = self._buffer
+        if buffer is None or written <= self._frames_read:
+            return None
+        capacity = len(buffer)
+        blocksize = self.config.blocksize
+        # Readers that fall too far behind skip ahead rather than stall:
+        # past queue_maxsize blocks, or past what the ring still holds.
+        oldest = written - self.config.queue_maxsize * blocksize
+        if self._max_chunks:
+            oldest = max(oldest, written - capacity)
+        first = max(self._frames_read, oldest)
+        last = min(written, first + (blocksize if out is None else len(out)))
+        chunk = self._copy_out(buffer, first, last, out)
+        if self._max_chunks and self._frames_written - capacity > first:
+            # The callback lapped us mid-copy; drop the torn block.
+            self._frames_read = self._frames_written - capacity
+            return None
+        self._frames_read = last
+        return chunk
 
     def is_available(self) -> bool:
         """Check if audio recording is available."""
         if sd is None:
             return False
 
+        cached = self._availability_cache
+        if cached is not None and time.monotonic() - cached[0] < _DEVICE_CACHE_TTL:
+            return cached[1]
         try:
             devices = sd.query_devices()
-            return any(d.get("max_input_channels", 0) > 0 for d in devices)
+            available = any(d.get("max_input_channels", 0) > 0 for d in devices)
         except Exception:
-            return False
+            available = False
+        self._availability_cache = (time.monotonic(), available)
+        return available
 
     def get_devices(self) -> list[dict]:
         """Get available input devices.
@@ -89,15 +215,24 @@ class AudioRecorder:
         if sd is None:
             return []
 
+        cached = self._devices_cache
+        if cached is not None and time.monotonic() - cached[0] < _DEVICE_CACHE_TTL:
+            return list(cached[1])
         try:
             devices = sd.query_devices()
-            return [
+            inputs = [
                 {"name": d["name"], "index": i, "channels": d["max_input_channels"]}
                 for i, d in enumerate(devices)
                 if d["max_input_channels"] > 0
             ]
         except Exception:
-            return []
+            inputs = []
+        self._devices_cache = (time.monotonic(), inputs)
+        return list(inputs)
+
+    def _invalidate_device_cache(self) -> None:
+        self._availability_cache = None
+        self._devices_cache = None
 
     def start(self) -> bool:
         """Start recording audio.
@@ -112,20 +247,7 @@ class AudioRecorder:
             return True
 
         try:
-            self._audio_queue = queue.Queue(maxsize=self.config.queue_maxsize)
-            self._recorded_chunks = (
-                deque(maxlen=self._max_chunks) if self._max_chunks else deque()
-            )
-
-            def callback(indata, frames, time_info, status):
-                if status:
-                    self._logger.debug("Audio callback status: %s", status)
-                try:
-                    self._audio_queue.put_nowait(indata.copy())
-                except queue.Full:
-                    self._logger.debug("Audio queue full; dropping chunk")
-                with self._lock:
-                    self._recorded_chunks.append(indata.copy())
+            self._reset_buffer()
 
             self._stream = sd.InputStream(
                 samplerate=self.config.sample_rate,
@@ -133,7 +255,7 @@ class AudioRecorder:
                 dtype=self.config.dtype,
                 blocksize=self.config.blocksize,
                 device=self.config.device,
-                callback=callback,
+                callback=self._on_audio_block,
             )
             self._stream.start()
             self._recording = True
@@ -141,6 +263,8 @@ class AudioRecorder:
 
         except Exception:
             self._logger.exception("Failed to start audio recording")
+            # The device set may have changed; don't keep reporting stale state.
+            self._invalidate_device_cache()
             return False
 
     def stop(self) -> Optional[np.ndarray]:
@@ -161,14 +285,17 @@ class AudioRecorder:
         self._stream = None
         self._recording = False
 
-        with self._lock:
-            if not self._recorded_chunks:
-                return None
+        # The stream is stopped, so the callback can no longer write.
+        audio = self._recorded_audio()
+        self._buffer = None
+        return audio
 
-            # Concatenate all chunks
-            audio = np.concatenate(list(self._recorded_chunks))
-            self._recorded_chunks = deque()
-            return np.squeeze(audio)
+    def _on_audio_block(self, indata, frames, time_info, status) -> None:
+        """sounddevice stream callback; runs on the PortAudio thread."""
+        if status:
+            self._logger.debug("Audio callback status: %s", status)
+        # indata is (frames, channels); take the mono column as a view.
+        self._store_block(indata[:, 0] if self.config.channels == 1 else indata)
 
     def get_chunk(self, timeout: float = 0.1) -> Optional[np.ndarray]:
         """Get the next audio chunk from the recording stream.
@@ -179,11 +306,20 @@ class AudioRecorder:
         Returns:
             Audio chunk as numpy array, or None if timeout.
         """
-        try:
-            chunk = self._audio_queue.get(timeout=timeout)
-            return np.squeeze(chunk)
-        except queue.Empty:
-            return None
+        return self._next_chunk(timeout)
+
+    def _next_chunk(
+        self, timeout: float, out: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        deadline = time.monotonic() + timeout
+        while True:
+            chunk = self._read_block(out)
+            if chunk is not None:
+                return chunk
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(remaining, _CHUNK_POLL_SECONDS))
 
     def iter_chunks(self) -> Generator[np.ndarray, None, None]:
         """Iterate over audio chunks while recording.
@@ -196,6 +332,25 @@ class AudioRecorder:
             if chunk is not None:
                 yield chunk
 
+    def iter_chunks_into(self, out: np.ndarray) -> Generator[np.ndarray, None, None]:
+        """Iterate over audio chunks while recording, reusing one buffer.
+
+        Each chunk is copied into ``out`` instead of a fresh array, so a
+        level meter or VAD loop can stream without per-block allocations.
+        The yielded array is overwritten by the next iteration.
+
+        Args:
+            out: Preallocated array shaped like a chunk: ``(blocksize,)`` for
+                mono, ``(blocksize, channels)`` otherwise.
+
+        Yields:
+            ``out``, or a leading slice of it when fewer frames were ready.
+        """
+        while self._recording:
+            chunk = self._next_chunk(0.1, out)
+            if chunk is not None:
+                yield chunk
+
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
@@ -213,17 +368,44 @@ class AudioRecorder:
         if chunk.size == 0:
             return 0.0
 
-        # RMS volume
-        rms = np.sqrt(np.mean(chunk**2))
+        # RMS volume: a dot product is a single SIMD pass with no squared
+        # temporary (chunk**2 would allocate one).
+        if chunk.dtype == np.float32 and chunk.ndim == 1 and chunk.flags.c_contiguous:
+            samples = chunk
+        else:
+            samples = np.ascontiguousarray(chunk, dtype=np.float32).ravel()
+        rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
 
         # Normalize to 0-1 range (assuming typical voice levels)
-        # Adjust these thresholds based on testing
-        min_db = -60
-        max_db = -10
-        db = 20 * np.log10(max(rms, 1e-10))
-        normalized = (db - min_db) / (max_db - min_db)
+        normalized = _LOG10_SCALE * math.log10(max(rms, 1e-10)) + _LOG10_OFFSET
         return max(0.0, min(1.0, normalized))
 
+    def get_volume_levels(self, buf: np.ndarray, hop: int) -> np.ndarray:
+        """Calculate volume levels (0-1) for consecutive windows of a recording.
+
+        Args:
+            buf: Recorded audio, e.g. the array returned by stop().
+            hop: Frames per window; a trailing partial window is ignored.
+
+        Returns:
+            One volume level per window, matching get_volume_level().
+        """
+        if hop <= 0:
+            raise ValueError("hop must be positive")
+        windows = len(buf) // hop
+        if windows == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # One pass over memory for every window instead of a call per block.
+        samples = np.ascontiguousarray(buf[: windows * hop], dtype=np.float32)
+        samples = samples.reshape(windows, -1)
+        mean_square = np.einsum("ij,ij->i", samples, samples) / samples.shape[1]
+        # log10(rms) == 0.5 * log10(mean square); same 1e-10 RMS floor.
+        levels = np.log10(np.maximum(mean_square, 1e-20))
+        levels *= 0.5 * _LOG10_SCALE
+        levels += _LOG10_OFFSET
+        return np.clip(levels, 0.0, 1.0, out=levels)
+
 
 def get_sounddevice_import_error() -> Exception | None:
     """Return the sounddevice import error, if any."""
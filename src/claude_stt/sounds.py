@@ -1,15 +1,19 @@
 """Audio feedback using native system sounds."""
 
+import functools
 import logging
 import os
 import platform
 import shutil
+import signal
 import subprocess
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 SoundEvent = Literal["start", "stop", "complete", "error", "warning"]
 _logger = logging.getLogger(__name__)
+_SYSTEM = platform.system()
 
 # macOS system sounds
 MACOS_SOUNDS = {
@@ -30,78 +34,243 @@ LINUX_SOUNDS = {
 }
 
 
+def _available_sounds(sounds: dict[str, str]) -> dict[str, str]:
+    return {event: path for event, path in sounds.items() if os.path.isfile(path)}
+
+
+# The system sound files don't change during a session; stat them once.
+_AVAILABLE_MACOS_SOUNDS = _available_sounds(MACOS_SOUNDS) if _SYSTEM == "Darwin" else {}
+_AVAILABLE_LINUX_SOUNDS = _available_sounds(LINUX_SOUNDS) if _SYSTEM == "Linux" else {}
+
+
 def play_sound(event: SoundEvent) -> None:
     """Play a native system sound for the given event.
 
     Args:
         event: The type of sound event to play.
     """
-    system = platform.system()
-
     try:
-        if system == "Darwin":
-            _play_macos_sound(event)
-        elif system == "Linux":
-            _play_linux_sound(event)
-        elif system == "Windows":
-            _play_windows_sound(event)
+        play = _play_funcs().get(event)
+        if play is not None:
+            play()
     except Exception:
         # Silently fail if sound playback doesn't work
         pass
 
 
-def _play_macos_sound(event: SoundEvent) -> None:
+@functools.lru_cache(maxsize=1)
+def _play_funcs() -> dict[str, Callable[[], object]]:
+    """Resolve a zero-argument player per event for this system, once."""
+    # Prefer in-process playback; spawning a player costs more than the sound.
+    if _SYSTEM == "Darwin":
+        players = _audiotoolbox_players(_AVAILABLE_MACOS_SOUNDS)
+        if players is not None:
+            return players
+        return _command_players(MACOS_SOUNDS, _AVAILABLE_MACOS_SOUNDS, _macos_player_argv())
+    if _SYSTEM == "Linux":
+        players = _canberra_players(_AVAILABLE_LINUX_SOUNDS)
+        if players is not None:
+            return players
+        return _command_players(LINUX_SOUNDS, _AVAILABLE_LINUX_SOUNDS, _linux_player_argv())
+    if _SYSTEM == "Windows":
+        return _windows_players()
+    return {}
+
+
+def _audiotoolbox_players(available: dict[str, str]) -> dict[str, Callable[[], object]] | None:
+    """Play sound on macOS in-process via AudioToolbox system sounds."""
+    if not available:
+        return None
+    try:
+        import ctypes
+
+        core_foundation = ctypes.CDLL(
+            "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+        )
+        audio_toolbox = ctypes.CDLL(
+            "/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox"
+        )
+    except (ImportError, OSError):
+        return None
+
+    create_url = core_foundation.CFURLCreateFromFileSystemRepresentation
+    create_url.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool]
+    create_url.restype = ctypes.c_void_p
+    cf_release = core_foundation.CFRelease
+    cf_release.argtypes = [ctypes.c_void_p]
+    cf_release.restype = None
+    create_sound = audio_toolbox.AudioServicesCreateSystemSoundID
+    create_sound.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+    create_sound.restype = ctypes.c_int32
+    play_sound_id = audio_toolbox.AudioServicesPlaySystemSound
+    play_sound_id.argtypes = [ctypes.c_uint32]
+    play_sound_id.restype = None
+
+    # Sound IDs are registered once and live for the rest of the process.
+    players = {}
+    for event, sound_file in available.items():
+        path = os.fsencode(sound_file)
+        url = create_url(None, path, len(path), False)
+        if not url:
+            continue
+        sound_id = ctypes.c_uint32(0)
+        status = create_sound(url, ctypes.byref(sound_id))
+        cf_release(url)
+        if status != 0:
+            _logger.debug("AudioServicesCreateSystemSoundID failed (%d): %s", status, sound_file)
+            continue
+        players[event] = functools.partial(play_sound_id, sound_id.value)
+    return players or None
+
+
+def _canberra_players(available: dict[str, str]) -> dict[str, Callable[[], object]] | None:
+    """Play sound on Linux in-process via libcanberra."""
+    if not available:
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+
+        canberra = ctypes.CDLL(ctypes.util.find_library("canberra") or "libcanberra.so.0")
+    except (ImportError, OSError):
+        return None
+
+    context_create = canberra.ca_context_create
+    context_create.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    context_create.restype = ctypes.c_int
+    context_open = canberra.ca_context_open
+    context_open.argtypes = [ctypes.c_void_p]
+    context_open.restype = ctypes.c_int
+    context_destroy = canberra.ca_context_destroy
+    context_destroy.argtypes = [ctypes.c_void_p]
+    context_destroy.restype = ctypes.c_int
+    # ca_context_play is variadic: (context, id, key, value, ..., NULL).
+    # argtypes covers the fixed prefix; the tail is passed as explicit
+    # char pointers so nothing relies on ctypes' default conversions.
+    ca_play = canberra.ca_context_play
+    ca_play.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    ca_play.restype = ctypes.c_int
+
+    context = ctypes.c_void_p()
+    if context_create(ctypes.byref(context)) != 0:
+        return None
+    # Connect to the sound server now so a dead backend falls back to a player.
+    if context_open(context) != 0:
+        context_destroy(context)
+        _logger.debug("libcanberra could not open a sound backend")
+        return None
+
+    # The context stays referenced by the partials for the process lifetime.
+    return {
+        event: functools.partial(
+            ca_play,
+            context,
+            0,
+            ctypes.c_char_p(b"media.filename"),
+            ctypes.c_char_p(os.fsencode(sound_file)),
+            ctypes.c_char_p(None),
+        )
+        for event, sound_file in available.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    return shutil.which(name)
+
+
+def _command_players(
+    sounds: dict[str, str], available: dict[str, str], argv: tuple[str, ...] | None
+) -> dict[str, Callable[[], object]]:
+    if argv is None:
+        _logger.debug("No sound player available")
+        return {}
+    players = {}
+    for event, sound_file in sounds.items():
+        if event not in available:
+            _logger.debug("Sound file missing: %s", sound_file)
+            continue
+        players[event] = functools.partial(_spawn_player, [*argv, available[event]])
+    return players
+
+
+# Player output goes to /dev/null, as with Popen(stdout=DEVNULL, stderr=DEVNULL).
+_SPAWN_FILE_ACTIONS = (
+    [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    if hasattr(os, "posix_spawn")
+    else None
+)
+# Python ignores SIGPIPE and SIGXFSZ; Popen(restore_signals=True) resets them
+# for the child, so the spawned player gets the same defaults.
+_SPAWN_SIGDEF = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+)
+_spawned_players: list[int] = []
+_spawned_players_lock = threading.Lock()
+
+
+def _spawn_player(argv: list[str]) -> None:
+    """Start a player without waiting for it to finish.
+
+    posix_spawn avoids Popen's fork path and fd sanitation; Popen remains the
+    fallback. argv[0] is the absolute path resolved by _which().
+    """
+    if _SPAWN_FILE_ACTIONS is not None:
+        try:
+            pid = os.posix_spawn(
+                argv[0],
+                argv,
+                os.environ,
+                file_actions=_SPAWN_FILE_ACTIONS,
+                setsigdef=_SPAWN_SIGDEF,
+            )
+        except OSError:
+            _logger.debug("posix_spawn failed; falling back to Popen", exc_info=True)
+        else:
+            with _spawned_players_lock:
+                _reap_players()
+                _spawned_players.append(pid)
+            return
+    subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _reap_players() -> None:
+    """Collect exited players so they don't linger as zombies (lock held)."""
+    for pid in list(_spawned_players):
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            _spawned_players.remove(pid)
+
+
+def _macos_player_argv() -> tuple[str, ...] | None:
     """Play sound on macOS using afplay."""
-    sound_file = MACOS_SOUNDS.get(event)
-    if not sound_file:
-        return
-    if not Path(sound_file).exists():
-        _logger.debug("Sound file missing: %s", sound_file)
-        return
-    if shutil.which("afplay") is None:
-        _logger.debug("afplay not available")
-        return
-    subprocess.Popen(
-        ["afplay", sound_file],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-
-
-def _play_linux_sound(event: SoundEvent) -> None:
-    """Play sound on Linux using pw-play, paplay, or aplay."""
-    sound_file = LINUX_SOUNDS.get(event)
-    if not sound_file:
-        return
-    if not Path(sound_file).exists():
-        _logger.debug("Sound file missing: %s", sound_file)
-        return
+    afplay = _which("afplay")
+    return (afplay,) if afplay else None
 
+
+def _linux_player_argv() -> tuple[str, ...] | None:
+    """Play sound on Linux using pw-play, paplay, or aplay."""
     # Try pw-play first (PipeWire native) when the PipeWire socket is present
-    if shutil.which("pw-play") and _pipewire_socket_available():
-        subprocess.Popen(
-            ["pw-play", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+    pw_play = _which("pw-play")
+    if pw_play and _pipewire_socket_available():
+        return (pw_play,)
 
     # Try paplay (PulseAudio)
-    if shutil.which("paplay"):
-        subprocess.Popen(
-            ["paplay", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+    paplay = _which("paplay")
+    if paplay:
+        return (paplay,)
 
     # Fall back to aplay (ALSA) - note: may not support .oga files
-    if shutil.which("aplay"):
-        subprocess.Popen(
-            ["aplay", "-q", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+    aplay = _which("aplay")
+    if aplay:
+        return (aplay, "-q")
+    return None
 
 
 def _pipewire_socket_available() -> bool:
@@ -115,21 +284,23 @@ def _pipewire_socket_available() -> bool:
     return remote_path.exists()
 
 
-def _play_windows_sound(event: SoundEvent) -> None:
+def _windows_players() -> dict[str, Callable[[], object]]:
     """Play sound on Windows using winsound."""
     try:
         import winsound
-
-        # Map events to Windows system sounds
-        sound_map = {
-            "start": winsound.MB_OK,
-            "stop": winsound.MB_OK,
-            "complete": winsound.MB_OK,
-            "error": winsound.MB_ICONHAND,
-            "warning": winsound.MB_ICONEXCLAMATION,
-        }
-
-        sound_type = sound_map.get(event, winsound.MB_OK)
-        winsound.MessageBeep(sound_type)
     except ImportError:
         _logger.debug("winsound not available")
+        return {}
+
+    # Map events to Windows system sounds
+    sound_map = {
+        "start": winsound.MB_OK,
+        "stop": winsound.MB_OK,
+        "complete": winsound.MB_OK,
+        "error": winsound.MB_ICONHAND,
+        "warning": winsound.MB_ICONEXCLAMATION,
+    }
+    return {
+        event: functools.partial(winsound.MessageBeep, sound_type)
+        for event, sound_type in sound_map.items()
+    }
@@ -19,6 +19,76 @@ class WindowInfo:
     app_name: Optional[str] = None
 
 
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+
+    # Bind the user32 entry points once with explicit signatures so each
+    # focus capture/restore skips attribute lookup and argument inference.
+    _user32 = ctypes.windll.user32
+    _GetForegroundWindow = _user32.GetForegroundWindow
+    _GetForegroundWindow.argtypes = []
+    _GetForegroundWindow.restype = wintypes.HWND
+    _IsWindow = _user32.IsWindow
+    _IsWindow.argtypes = [wintypes.HWND]
+    _IsWindow.restype = wintypes.BOOL
+    _IsIconic = _user32.IsIconic
+    _IsIconic.argtypes = [wintypes.HWND]
+    _IsIconic.restype = wintypes.BOOL
+    _IsZoomed = _user32.IsZoomed
+    _IsZoomed.argtypes = [wintypes.HWND]
+    _IsZoomed.restype = wintypes.BOOL
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    _ShowWindow.restype = wintypes.BOOL
+    _SetForegroundWindow = _user32.SetForegroundWindow
+    _SetForegroundWindow.argtypes = [wintypes.HWND]
+    _SetForegroundWindow.restype = wintypes.BOOL
+
+_SW_SHOWMAXIMIZED = 3
+_SW_SHOW = 5
+_SW_RESTORE = 9
+
+
+_SCRIPT_GET_WINDOW = '''
+tell application "System Events"
+    set frontApp to first application process whose frontmost is true
+    set appName to name of frontApp
+    try
+        set winId to id of front window of frontApp
+        return appName & "\n" & winId
+    on error
+        return appName & "\n"
+    end try
+end tell
+'''
+
+_SCRIPT_APP_AND_WIN = '''
+tell application "System Events"
+    tell process "{app_name}"
+        set frontmost to true
+        if (exists (first window whose id is {window_id})) then
+            perform action "AXRaise" of (first window whose id is {window_id})
+        end if
+    end tell
+end tell
+'''
+
+_SCRIPT_APP_ONLY = '''
+tell application "System Events"
+    tell process "{app_name}"
+        set frontmost to true
+    end tell
+end tell
+'''
+
+_SCRIPT_WIN_ONLY = '''
+tell application "System Events"
+    set frontmost of (first process whose unix id is {window_id}) to true
+end tell
+'''
+
+
 def get_active_window() -> Optional[WindowInfo]:
     """Capture the currently active window.
 
@@ -69,21 +139,8 @@ def restore_focus(window_info: Optional[WindowInfo]) -> bool:
 
 def _get_macos_window() -> Optional[WindowInfo]:
     """Get active window on macOS using AppleScript."""
-    script = '''
-    tell application "System Events"
-        set frontApp to first application process whose frontmost is true
-        set appName to name of frontApp
-        try
-            set winId to id of front window of frontApp
-            return appName & "\n" & winId
-        on error
-            return appName & "\n"
-        end try
-    end tell
-    '''
-
     result = subprocess.run(
-        ["osascript", "-e", script],
+        ["osascript", "-e", _SCRIPT_GET_WINDOW],
         capture_output=True,
         text=True,
         timeout=2,
@@ -115,30 +172,11 @@ def _restore_macos_focus(window_info: WindowInfo) -> bool:
         window_id = None
 
     if app_name and window_id:
-        script = f'''
-        tell application "System Events"
-            tell process "{app_name}"
-                set frontmost to true
-                if (exists (first window whose id is {window_id})) then
-                    perform action "AXRaise" of (first window whose id is {window_id})
-                end if
-            end tell
-        end tell
-        '''
+        script = _SCRIPT_APP_AND_WIN.format(app_name=app_name, window_id=window_id)
     elif app_name:
-        script = f'''
-        tell application "System Events"
-            tell process "{app_name}"
-                set frontmost to true
-            end tell
-        end tell
-        '''
+        script = _SCRIPT_APP_ONLY.format(app_name=app_name)
     elif window_id:
-        script = f'''
-        tell application "System Events"
-            set frontmost of (first process whose unix id is {window_id}) to true
-        end tell
-        '''
+        script = _SCRIPT_WIN_ONLY.format(window_id=window_id)
     else:
         return False
 
@@ -209,10 +247,7 @@ def _restore_linux_focus(window_info: WindowInfo) -> bool:
 def _get_windows_window() -> Optional[WindowInfo]:
     """Get active window on Windows using ctypes."""
     try:
-        import ctypes
-
-        user32 = ctypes.windll.user32
-        hwnd = user32.GetForegroundWindow()
+        hwnd = _GetForegroundWindow()
 
         if hwnd:
             return WindowInfo(window_id=str(hwnd), platform="Windows")
@@ -225,28 +260,21 @@ def _get_windows_window() -> Optional[WindowInfo]:
 def _restore_windows_focus(window_info: WindowInfo) -> bool:
     """Restore focus on Windows using ctypes."""
     try:
-        import ctypes
-
-        user32 = ctypes.windll.user32
         hwnd = int(window_info.window_id)
 
-        if not user32.IsWindow(hwnd):
+        if not _IsWindow(hwnd):
             return False
 
         # Show and activate the window
-        SW_SHOW = 5
-        SW_SHOWMAXIMIZED = 3
-        SW_RESTORE = 9
-
-        if user32.IsIconic(hwnd):
-            show_flag = SW_RESTORE
-        elif user32.IsZoomed(hwnd):
-            show_flag = SW_SHOWMAXIMIZED
+        if _IsIconic(hwnd):
+            show_flag = _SW_RESTORE
+        elif _IsZoomed(hwnd):
+            show_flag = _SW_SHOWMAXIMIZED
         else:
-            show_flag = SW_SHOW
+            show_flag = _SW_SHOW
 
-        user32.ShowWindow(hwnd, show_flag)
-        if not user32.SetForegroundWindow(hwnd):
+        _ShowWindow(hwnd, show_flag)
+        if not _SetForegroundWindow(hwnd):
             return False
 
         time.sleep(0.1)  # Allow focus to settle
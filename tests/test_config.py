@@ -1,4 +1,8 @@
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from claude_stt.config import Config
 
@@ -21,6 +25,30 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(config.max_recording_seconds, 1)
         self.assertEqual(config.sample_rate, 16000)
 
+    def test_config_dir_cache_follows_env_override(self):
+        original = os.environ.get("CLAUDE_STT_CONFIG_DIR")
+        try:
+            with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+                os.environ["CLAUDE_STT_CONFIG_DIR"] = first
+                self.assertEqual(Config.get_config_dir(), Path(first))
+                self.assertIs(Config.get_config_dir(), Config.get_config_dir())
+                os.environ["CLAUDE_STT_CONFIG_DIR"] = second
+                self.assertEqual(Config.get_config_dir(), Path(second))
+        finally:
+            if original is None:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+            else:
+                os.environ["CLAUDE_STT_CONFIG_DIR"] = original
+
+
+    def test_config_dir_follows_home(self):
+        home_var = "USERPROFILE" if os.name == "nt" else "HOME"
+        with tempfile.TemporaryDirectory() as home, mock.patch.dict(os.environ):
+            os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+            os.environ[home_var] = home
+            expected = Path(home) / ".claude" / "plugins" / "claude-stt"
+            self.assertEqual(Config.get_config_dir(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
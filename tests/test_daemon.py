@@ -1,9 +1,15 @@
+import json
 import os
+import subprocess
+import sys
 import tempfile
 import unittest
 
 from claude_stt import daemon
 
+# Above any kernel pid_max, so /proc never has an entry for it.
+_UNUSED_PID = 2**31 - 2
+
 
 class DaemonPidTests(unittest.TestCase):
     def test_pid_file_round_trip(self):
@@ -14,6 +20,7 @@ class DaemonPidTests(unittest.TestCase):
                 data = daemon._read_pid_file()
                 self.assertIsNotNone(data)
                 self.assertEqual(data["pid"], os.getpid())
+                self.assertEqual(daemon._read_pid_only(), os.getpid())
                 self.assertIn("command", data)
                 self.assertIn("created_at", data)
             finally:
@@ -29,6 +36,7 @@ class DaemonPidTests(unittest.TestCase):
                 data = daemon._read_pid_file()
                 self.assertIsNotNone(data)
                 self.assertEqual(data["pid"], os.getpid())
+                self.assertEqual(daemon._read_pid_only(), os.getpid())
             finally:
                 os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
 
@@ -36,15 +44,111 @@ class DaemonPidTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
             original_get_process_command = daemon._get_process_command
+            original_read_proc_cmdline = daemon._read_proc_cmdline
             try:
-                daemon._write_pid_file(os.getpid())
+                pid_path = daemon.get_pid_file()
+                pid_path.parent.mkdir(parents=True, exist_ok=True)
+                pid_path.write_text(str(os.getppid()))
+                daemon._read_proc_cmdline = lambda pid: b"python\x00other-process"
                 daemon._get_process_command = lambda pid: "python other-process"
                 self.assertFalse(daemon.is_daemon_running())
                 self.assertFalse(daemon.get_pid_file().exists())
             finally:
+                daemon._read_proc_cmdline = original_read_proc_cmdline
                 daemon._get_process_command = original_get_process_command
                 os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
 
+    @unittest.skipUnless(os.path.isdir("/proc/self"), "requires procfs")
+    def test_pid_file_start_time_identifies_process(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            original_get_process_command = daemon._get_process_command
+            process = subprocess.Popen(
+                [sys.executable, "-c", "import sys; sys.stdin.read()"],
+                stdin=subprocess.PIPE,
+            )
+            try:
+                daemon._write_pid_file(process.pid)
+                data = daemon._read_pid_file()
+                self.assertIsInstance(data["start_time"], int)
+                daemon._get_process_command = lambda pid: self.fail("unexpected lookup")
+                self.assertTrue(daemon.is_daemon_running())
+
+                # Same PID, different start time: the PID was reused.
+                data["start_time"] -= 1
+                daemon.get_pid_file().write_text(json.dumps(data))
+                self.assertFalse(daemon.is_daemon_running())
+                self.assertFalse(daemon.get_pid_file().exists())
+            finally:
+                process.stdin.close()
+                process.kill()
+                process.wait()
+                daemon._get_process_command = original_get_process_command
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_process_command_lookup_is_cached(self):
+        original_uncached = daemon._get_process_command_uncached
+        calls = []
+
+        def fake_uncached(pid):
+            calls.append(pid)
+            return "python -m claude_stt.daemon run"
+
+        try:
+            daemon._invalidate_process_command()
+            daemon._get_process_command_uncached = fake_uncached
+            self.assertTrue(daemon._pid_looks_like_claude_stt(_UNUSED_PID))
+            self.assertTrue(daemon._pid_looks_like_claude_stt(_UNUSED_PID))
+            self.assertEqual(calls, [_UNUSED_PID])
+
+            daemon._invalidate_process_command(_UNUSED_PID)
+            daemon._get_process_command(_UNUSED_PID)
+            self.assertEqual(calls, [_UNUSED_PID, _UNUSED_PID])
+
+            daemon._invalidate_process_command(_UNUSED_PID)
+            daemon._prefetch_process_command(_UNUSED_PID)
+            self.assertTrue(daemon._pid_looks_like_claude_stt(_UNUSED_PID))
+            self.assertEqual(calls, [_UNUSED_PID, _UNUSED_PID, _UNUSED_PID])
+        finally:
+            daemon._get_process_command_uncached = original_uncached
+            daemon._invalidate_process_command()
+
+    @unittest.skipIf(os.name == "nt", "procfs path is POSIX only")
+    def test_running_check_matches_raw_cmdline_without_decoding(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            original_get_process_command = daemon._get_process_command
+            original_read_proc_cmdline = daemon._read_proc_cmdline
+            try:
+                pid_path = daemon.get_pid_file()
+                pid_path.parent.mkdir(parents=True, exist_ok=True)
+                pid_path.write_text(str(os.getppid()))
+                daemon._invalidate_process_command()
+                daemon._read_proc_cmdline = lambda pid: b"python\x00-m\x00claude_stt.daemon"
+                daemon._get_process_command = lambda pid: self.fail("unexpected lookup")
+                self.assertTrue(daemon.is_daemon_running())
+            finally:
+                daemon._read_proc_cmdline = original_read_proc_cmdline
+                daemon._get_process_command = original_get_process_command
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_cmdline_matcher_handles_raw_bytes(self):
+        self.assertTrue(daemon._cmdline_matches_claude_stt(b"python\x00-m\x00claude_stt.daemon"))
+        self.assertFalse(daemon._cmdline_matches_claude_stt(b"python\x00other.py"))
+
+    def test_wait_for_exit_tracks_process_lifetime(self):
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdin.read()"],
+            stdin=subprocess.PIPE,
+        )
+        try:
+            self.assertFalse(daemon._wait_for_exit(process.pid, timeout=0.1))
+            process.stdin.close()
+            self.assertTrue(daemon._wait_for_exit(process.pid, timeout=5.0))
+        finally:
+            process.kill()
+            process.wait()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from claude_stt.config import Config
 from claude_stt.engine_factory import build_engine
+from claude_stt.engines import whisper
 from claude_stt.engines.whisper import WhisperEngine
 from claude_stt.errors import EngineError
 
@@ -19,6 +20,36 @@ class EngineFactoryTests(unittest.TestCase):
         engine = build_engine(config)
         self.assertIsInstance(engine, WhisperEngine)
 
+    def test_whisper_models_shared_between_engines(self):
+        original_model = whisper._WhisperModel
+        original_available = whisper._whisper_available
+        original_cache = dict(WhisperEngine._MODEL_CACHE)
+        loads = []
+
+        def fake_model(name, device, compute_type, **kwargs):
+            loads.append((name, device, compute_type, "cpu_threads" in kwargs))
+            return object()
+
+        try:
+            whisper._WhisperModel = fake_model
+            whisper._whisper_available = True
+            WhisperEngine._MODEL_CACHE.clear()
+            first = WhisperEngine(model_name="tiny", device="cpu", compute_type="int8")
+            second = WhisperEngine(model_name="tiny", device="cpu", compute_type="int8")
+            self.assertTrue(first.load_model())
+            self.assertTrue(second.load_model())
+            self.assertIs(first._model, second._model)
+            self.assertEqual(loads, [("tiny", "cpu", "int8", True)])
+
+            gpu = WhisperEngine(model_name="tiny", device="cuda")
+            self.assertTrue(gpu.load_model())
+            self.assertEqual(loads[-1], ("tiny", "cuda", "int8_float16", False))
+        finally:
+            whisper._WhisperModel = original_model
+            whisper._whisper_available = original_available
+            WhisperEngine._MODEL_CACHE.clear()
+            WhisperEngine._MODEL_CACHE.update(original_cache)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from claude_stt import recorder as recorder_module
+from claude_stt.recorder import AudioRecorder, RecorderConfig
+
+
+class _FakeStream:
+    def stop(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class AudioRecorderBufferTests(unittest.TestCase):
+    def _recorder(self, max_recording_seconds):
+        recorder = AudioRecorder(
+            RecorderConfig(
+                sample_rate=8,
+                blocksize=4,
+                max_recording_seconds=max_recording_seconds,
+            )
+        )
+        recorder._reset_buffer()
+        recorder._recording = True
+        recorder._stream = _FakeStream()
+        return recorder
+
+    def _feed(self, recorder, start, stop):
+        block = np.arange(start, stop, dtype=np.float32).reshape(-1, 1)
+        recorder._on_audio_block(block, len(block), None, None)
+
+    def test_stop_returns_recorded_frames_in_order(self):
+        recorder = self._recorder(max_recording_seconds=None)
+        for start in range(0, 400, 4):
+            self._feed(recorder, start, start + 4)
+        audio = recorder.stop()
+        np.testing.assert_array_equal(audio, np.arange(400, dtype=np.float32))
+
+    def test_bounded_recording_keeps_most_recent_frames(self):
+        # 1 second at 8 Hz in blocks of 4 -> room for 8 frames.
+        recorder = self._recorder(max_recording_seconds=1)
+        for start in range(0, 20, 4):
+            self._feed(recorder, start, start + 4)
+        audio = recorder.stop()
+        np.testing.assert_array_equal(audio, np.arange(12, 20, dtype=np.float32))
+
+    def test_get_chunk_reads_blocks_in_order(self):
+        recorder = self._recorder(max_recording_seconds=None)
+        self._feed(recorder, 0, 4)
+        self._feed(recorder, 4, 8)
+        np.testing.assert_array_equal(recorder.get_chunk(timeout=0), np.arange(4))
+        np.testing.assert_array_equal(recorder.get_chunk(timeout=0), np.arange(4, 8))
+        self.assertIsNone(recorder.get_chunk(timeout=0))
+        np.testing.assert_array_equal(recorder.stop(), np.arange(8, dtype=np.float32))
+
+    def test_iter_chunks_into_reuses_the_output_buffer(self):
+        recorder = self._recorder(max_recording_seconds=1)
+        for start in range(0, 12, 4):
+            self._feed(recorder, start, start + 4)
+        out = np.empty(4, dtype=np.float32)
+        chunks = recorder.iter_chunks_into(out)
+        # 12 frames through an 8-frame ring: the first block was overwritten.
+        for expected in (np.arange(4, 8), np.arange(8, 12)):
+            chunk = next(chunks)
+            self.assertIs(chunk, out)
+            np.testing.assert_array_equal(chunk, expected)
+
+    def test_get_chunk_skips_audio_the_ring_overwrote(self):
+        recorder = self._recorder(max_recording_seconds=1)
+        for start in range(0, 20, 4):
+            self._feed(recorder, start, start + 4)
+        np.testing.assert_array_equal(recorder.get_chunk(timeout=0), np.arange(12, 16))
+        np.testing.assert_array_equal(recorder.get_chunk(timeout=0), np.arange(16, 20))
+        self.assertIsNone(recorder.get_chunk(timeout=0))
+
+    def test_stereo_recording_keeps_channel_axis(self):
+        recorder = AudioRecorder(RecorderConfig(sample_rate=8, blocksize=4, channels=2))
+        recorder._reset_buffer()
+        recorder._recording = True
+        recorder._stream = _FakeStream()
+        block = np.arange(8, dtype=np.float32).reshape(4, 2)
+        recorder._on_audio_block(block, 4, None, None)
+        np.testing.assert_array_equal(recorder.stop(), block)
+
+    def test_stop_without_audio_returns_none(self):
+        recorder = self._recorder(max_recording_seconds=1)
+        self.assertIsNone(recorder.stop())
+
+
+class _FakeSoundDevice:
+    def __init__(self):
+        self.queries = 0
+
+    def query_devices(self):
+        self.queries += 1
+        return [
+            {"name": "Speakers", "max_input_channels": 0},
+            {"name": "Mic", "max_input_channels": 1},
+        ]
+
+    def InputStream(self, **kwargs):
+        raise RuntimeError("device busy")
+
+
+class DeviceCacheTests(unittest.TestCase):
+    def test_device_queries_are_cached_until_start_fails(self):
+        fake_sd = _FakeSoundDevice()
+        with mock.patch.object(recorder_module, "sd", fake_sd):
+            recorder = AudioRecorder()
+            self.assertTrue(recorder.is_available())
+            self.assertTrue(recorder.is_available())
+            self.assertEqual(
+                recorder.get_devices(), [{"name": "Mic", "index": 1, "channels": 1}]
+            )
+            recorder.get_devices()
+            self.assertEqual(fake_sd.queries, 2)
+
+            with self.assertLogs(recorder_module.__name__, level="ERROR"):
+                self.assertFalse(recorder.start())
+            self.assertTrue(recorder.is_available())
+            self.assertEqual(fake_sd.queries, 3)
+
+
+class VolumeLevelTests(unittest.TestCase):
+    def test_volume_level_normalizes_rms(self):
+        recorder = AudioRecorder()
+        self.assertEqual(recorder.get_volume_level(np.zeros(0, dtype=np.float32)), 0.0)
+        self.assertEqual(recorder.get_volume_level(np.zeros(1024, dtype=np.float32)), 0.0)
+        self.assertEqual(recorder.get_volume_level(np.ones(1024, dtype=np.float32)), 1.0)
+        # -35 dBFS sits halfway between the -60 and -10 dB bounds.
+        tone = np.full((1024, 1), 10 ** (-35 / 20), dtype=np.float32)
+        self.assertAlmostEqual(recorder.get_volume_level(tone), 0.5, places=5)
+
+    def test_volume_levels_match_per_block_levels(self):
+        recorder = AudioRecorder()
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(4 * 256 + 100) * 0.01).astype(np.float32)
+        audio[256:512] = 0.0
+        levels = recorder.get_volume_levels(audio, 256)
+        expected = [recorder.get_volume_level(audio[i : i + 256]) for i in range(0, 1024, 256)]
+        np.testing.assert_allclose(levels, expected, atol=1e-5)
+        self.assertEqual(len(recorder.get_volume_levels(audio[:100], 256)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import ctypes
+import ctypes.util
+import os
+import shutil
+import signal
+import tempfile
+import unittest
+from unittest import mock
+
+from claude_stt import sounds
+
+
+class _FakeLibrary:
+    """Stands in for a ctypes.CDLL: any symbol is a configurable mock."""
+
+    def __init__(self, **results):
+        self._functions = {}
+        for name, result in results.items():
+            self._functions[name] = mock.Mock(return_value=result)
+
+    def __getattr__(self, name):
+        return self._functions.setdefault(name, mock.Mock(return_value=0))
+
+
+class PlayerTableTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.sound_file = tempfile.mkstemp(suffix=".oga")
+        os.close(handle)
+        self.addCleanup(os.unlink, self.sound_file)
+        sounds._play_funcs.cache_clear()
+        self.addCleanup(sounds._play_funcs.cache_clear)
+
+    def _patch(self, system, library, which=lambda name: None):
+        available = {"start": self.sound_file}
+        patches = [
+            mock.patch.object(sounds, "_SYSTEM", system),
+            mock.patch.object(sounds, "_AVAILABLE_LINUX_SOUNDS", available),
+            mock.patch.object(sounds, "_AVAILABLE_MACOS_SOUNDS", available),
+            mock.patch.object(sounds, "_which", side_effect=which),
+            mock.patch.object(sounds, "_pipewire_socket_available", return_value=False),
+            mock.patch.object(ctypes, "CDLL", side_effect=library),
+            mock.patch.object(ctypes.util, "find_library", return_value="libcanberra.so.0"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_available_sounds_skips_missing_files(self):
+        found = sounds._available_sounds(
+            {"start": self.sound_file, "stop": self.sound_file + ".missing"}
+        )
+        self.assertEqual(found, {"start": self.sound_file})
+
+    def test_linux_prefers_canberra(self):
+        canberra = _FakeLibrary()
+        self._patch("Linux", lambda path: canberra)
+        players = sounds._play_funcs()
+        # Sound files that aren't present get no entry.
+        self.assertEqual(set(players), {"start"})
+
+        sounds.play_sound("start")
+        args = canberra.ca_context_play.call_args.args
+        self.assertEqual(args[2].value, b"media.filename")
+        self.assertEqual(args[3].value, os.fsencode(self.sound_file))
+        self.assertIsNone(args[4].value)
+        sounds.play_sound("stop")
+        self.assertEqual(canberra.ca_context_play.call_count, 1)
+
+    def test_linux_falls_back_to_player_when_canberra_cannot_open(self):
+        canberra = _FakeLibrary(ca_context_open=-1)
+        which = {"paplay": "/usr/bin/paplay"}.get
+        self._patch("Linux", lambda path: canberra, which)
+        players = sounds._play_funcs()
+        canberra.ca_context_destroy.assert_called_once()
+        self.assertEqual(set(players), {"start"})
+        self.assertIs(players["start"].func, sounds._spawn_player)
+        self.assertEqual(players["start"].args, (["/usr/bin/paplay", self.sound_file],))
+
+    def test_linux_falls_back_to_player_without_canberra(self):
+        def missing(path):
+            raise OSError(path)
+
+        self._patch("Linux", missing, {"aplay": "/usr/bin/aplay"}.get)
+        players = sounds._play_funcs()
+        self.assertEqual(players["start"].args, (["/usr/bin/aplay", "-q", self.sound_file],))
+
+    def test_macos_prefers_audiotoolbox(self):
+        libraries = {"CoreFoundation": _FakeLibrary(CFURLCreateFromFileSystemRepresentation=1)}
+        audio_toolbox = libraries.setdefault("AudioToolbox", _FakeLibrary())
+        self._patch("Darwin", lambda path: libraries[os.path.basename(path)])
+        players = sounds._play_funcs()
+        self.assertEqual(set(players), {"start"})
+        sounds.play_sound("start")
+        audio_toolbox.AudioServicesPlaySystemSound.assert_called_once()
+
+    def test_macos_falls_back_to_afplay_when_sound_id_fails(self):
+        libraries = {
+            "CoreFoundation": _FakeLibrary(CFURLCreateFromFileSystemRepresentation=1),
+            "AudioToolbox": _FakeLibrary(AudioServicesCreateSystemSoundID=-50),
+        }
+        self._patch(
+            "Darwin",
+            lambda path: libraries[os.path.basename(path)],
+            {"afplay": "/usr/bin/afplay"}.get,
+        )
+        players = sounds._play_funcs()
+        self.assertEqual(players["start"].args, (["/usr/bin/afplay", self.sound_file],))
+
+
+@unittest.skipUnless(hasattr(os, "posix_spawn"), "requires posix_spawn")
+class SpawnPlayerTests(unittest.TestCase):
+    def setUp(self):
+        sounds._spawned_players.clear()
+        self.addCleanup(sounds._spawned_players.clear)
+
+    def test_falls_back_to_popen_when_posix_spawn_fails(self):
+        with (
+            mock.patch.object(sounds.os, "posix_spawn", side_effect=OSError("no")),
+            mock.patch.object(sounds.subprocess, "Popen") as popen,
+        ):
+            sounds._spawn_player(["/usr/bin/paplay", "start.oga"])
+        popen.assert_called_once_with(
+            ["/usr/bin/paplay", "start.oga"],
+            stdout=sounds.subprocess.DEVNULL,
+            stderr=sounds.subprocess.DEVNULL,
+        )
+        self.assertEqual(sounds._spawned_players, [])
+
+    @unittest.skipUnless(os.path.exists("/proc/self/status"), "requires procfs")
+    def test_spawned_player_gets_default_signal_handlers(self):
+        # The child's ignored-signal mask shows whether SIGPIPE was reset.
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        grep = shutil.which("grep")
+        with mock.patch.object(
+            sounds, "_SPAWN_FILE_ACTIONS", [(os.POSIX_SPAWN_DUP2, write_fd, 1)]
+        ):
+            sounds._spawn_player([grep, "SigIgn", "/proc/self/status"])
+        os.close(write_fd)
+        os.waitpid(sounds._spawned_players[0], 0)
+        with os.fdopen(os.dup(read_fd)) as output:
+            ignored = int(output.read().split()[1], 16)
+        self.assertFalse(ignored & (1 << (signal.SIGPIPE - 1)))
+
+    def test_reaps_finished_players(self):
+        def waitpid(pid, options):
+            return (pid, 0) if pid == 101 else (0, 0)
+
+        with (
+            mock.patch.object(sounds.os, "posix_spawn", side_effect=[101, 102, 103]),
+            mock.patch.object(sounds.os, "waitpid", side_effect=waitpid),
+            mock.patch.object(sounds.subprocess, "Popen") as popen,
+        ):
+            sounds._spawn_player(["/usr/bin/paplay", "a.oga"])
+            sounds._spawn_player(["/usr/bin/paplay", "b.oga"])
+            self.assertEqual(sounds._spawned_players, [102])
+            sounds._spawn_player(["/usr/bin/paplay", "c.oga"])
+            self.assertEqual(sounds._spawned_players, [102, 103])
+        popen.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()